@@ -15,6 +15,9 @@
 """Cost estimator implementation based on a simplified model."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
 
 from spark_rapids_dataproc_tools.dataproc_utils import DataprocClusterPropContainer, get_incompatible_criteria
 from spark_rapids_dataproc_tools.utilities import AbstractPropertiesContainer, JSONPropertiesContainer
@@ -61,20 +64,41 @@ class DataprocPriceProvider(PriceProvider):
     def _get_machine_type(self) -> str:
         return self.meta.get('machineType')
 
-    def _get_machine_prefix(self) -> str:
-        return self._get_machine_type().split('-')[0]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_catalog_keys_for_machine(machine_type: str) -> (str, str, str):
+        """
+        Builds the keys of a machine type in the price catalog. The keys depend only on the machine
+        type, so they are built once for each type instead of every time a price is looked up.
+        :param machine_type: the machine type (i.e., n1-standard-8)
+        :return: tuple (cores_key, ram_key, vm_key)
+        """
+        machine_prefix = machine_type.split('-')[0].upper()
+        return (f'CP-COMPUTEENGINE-{machine_prefix}-PREDEFINED-VM-CORE',
+                f'CP-COMPUTEENGINE-{machine_prefix}-PREDEFINED-VM-RAM',
+                f'CP-COMPUTEENGINE-VMIMAGE-{machine_type.upper()}')
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_catalog_key_for_gpu(gpu_type: str) -> str:
+        """
+        Builds the key of a GPU device in the price catalog, once for each device type.
+        :param gpu_type: the short name of the GPU device (i.e., T4)
+        :return: the key of the GPU device in the catalog
+        """
+        return f'GPU_NVIDIA_TESLA_{gpu_type.upper()}'
 
     def __key_for_cpe_machine_cores(self) -> str:
-        return f'CP-COMPUTEENGINE-{self._get_machine_prefix().upper()}-PREDEFINED-VM-CORE'
+        return self._get_catalog_keys_for_machine(self._get_machine_type())[0]
 
     def __key_for_cpe_machine_ram(self) -> str:
-        return f'CP-COMPUTEENGINE-{self._get_machine_prefix().upper()}-PREDEFINED-VM-RAM'
+        return self._get_catalog_keys_for_machine(self._get_machine_type())[1]
 
     def __key_for_gpu_device(self) -> str:
-        return f'GPU_NVIDIA_TESLA_{self.meta.get("gpuType").upper()}'
+        return self._get_catalog_key_for_gpu(self.meta.get('gpuType'))
 
     def __key_for_cpe_vm(self) -> str:
-        return f'CP-COMPUTEENGINE-VMIMAGE-{self._get_machine_type().upper()}'
+        return self._get_catalog_keys_for_machine(self._get_machine_type())[2]
 
     def __get_region(self) -> str:
         return self.meta.get('region')
@@ -118,16 +142,32 @@ class DataprocSavingsEstimator(object):
     price_provider: DataprocPriceProvider
     gpu_device: str = 'T4'
     gpu_per_machine: int = 2
-    comments = []
+    comments: list = field(default_factory=list, init=False)
     target_cluster: DataprocClusterPropContainer = field(default=None, init=False)
     source_cluster: DataprocClusterPropContainer = field(default=None, init=False)
     cost_with_gpu: float = field(default=None, init=False)
     cost_no_gpu: float = field(default=None, init=False)
+    # costs of the master nodes that have already been calculated, keyed by the shape of the node
+    master_costs: dict = field(default_factory=dict, init=False)
 
     def calculate_master_cost(self, cluster_inst: DataprocClusterPropContainer) -> float:
-        # setup the cost provider for the master node
+        # the source and target clusters usually share the same master node. In that case, reuse the
+        # cost calculated for the first cluster instead of going through the catalog again.
         master_instances = cluster_inst.get_master_vm_instances()
-        master_region, master_zone, master_machine = cluster_inst.get_master_machine_info()
+        master_machine_info = cluster_inst.get_master_machine_info()
+        master_shape = (master_instances, master_machine_info, cluster_inst.get_master_local_ssds())
+        if master_shape not in self.master_costs:
+            self.master_costs[master_shape] = self.__calculate_master_cost(cluster_inst,
+                                                                           master_instances,
+                                                                           master_machine_info)
+        return self.master_costs[master_shape]
+
+    def __calculate_master_cost(self,
+                                cluster_inst: DataprocClusterPropContainer,
+                                master_instances: int,
+                                master_machine_info: tuple) -> float:
+        # setup the cost provider for the master node
+        master_region, master_zone, master_machine = master_machine_info
         self.price_provider.setup(
             region=master_region,
             zone=master_zone,
@@ -224,3 +264,38 @@ class DataprocSavingsEstimator(object):
         estimated_gpu_cost = self.cost_with_gpu * estimated_gpu_duration / (60.0 * 60 * 1000)
         estimated_savings = 100.0 - ((100.0 * estimated_gpu_cost) / estimated_cpu_cost)
         return estimated_cpu_cost, estimated_gpu_cost, estimated_savings
+
+    def get_costs_and_savings_for_apps(self,
+                                       app_durations: np.ndarray,
+                                       estimated_gpu_durations: np.ndarray):
+        """
+        Vectorized version of get_costs_and_savings that estimates the costs of all the applications
+        in a single pass. It returns the same values as get_costs_and_savings for each app: the costs of
+        an app with no positive CPU cost are all 0, and an app with a NaN duration gets NaN costs.
+        :param app_durations: array of the applications durations in milliseconds.
+        :param estimated_gpu_durations: array of the estimated GPU durations in milliseconds.
+        :return: tuple of arrays (estimated_cpu_cost, estimated_gpu_cost, estimated_savings).
+        """
+        # type the durations once. App Duration is loaded as an int64 column, and converting it here
+        # avoids an implicit upcast in each of the following operations.
+        app_durations = np.asarray(app_durations, dtype=np.float64)
+        estimated_gpu_durations = np.asarray(estimated_gpu_durations, dtype=np.float64)
+        # estimated_cpu_cost = self.cost_no_gpu * app_durations / (60.0 * 60 * 1000)
+        estimated_cpu_cost = np.multiply(app_durations, self.cost_no_gpu)
+        np.divide(estimated_cpu_cost, 60.0 * 60 * 1000, out=estimated_cpu_cost)
+        # avoid division by zero by skipping the apps that have no positive CPU cost. Similar to
+        # get_costs_and_savings, NaN costs are not skipped, so that they propagate to the results.
+        zero_costs = estimated_cpu_cost <= 0.0
+        np.copyto(estimated_cpu_cost, 0.0, where=zero_costs)
+        valid_costs = ~zero_costs
+        # the outputs are preallocated and filled in place to avoid the temporaries of each
+        # intermediate operation
+        estimated_gpu_cost = np.zeros_like(estimated_cpu_cost)
+        np.multiply(estimated_gpu_durations, self.cost_with_gpu, out=estimated_gpu_cost, where=valid_costs)
+        np.divide(estimated_gpu_cost, 60.0 * 60 * 1000, out=estimated_gpu_cost, where=valid_costs)
+        estimated_savings = np.zeros_like(estimated_cpu_cost)
+        # estimated_savings = 100.0 - ((100.0 * estimated_gpu_cost) / estimated_cpu_cost)
+        np.multiply(estimated_gpu_cost, 100.0, out=estimated_savings, where=valid_costs)
+        np.divide(estimated_savings, estimated_cpu_cost, out=estimated_savings, where=valid_costs)
+        np.subtract(100.0, estimated_savings, out=estimated_savings, where=valid_costs)
+        return estimated_cpu_cost, estimated_gpu_cost, estimated_savings
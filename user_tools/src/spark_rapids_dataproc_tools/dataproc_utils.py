@@ -16,7 +16,9 @@
 import os
 import re
 import subprocess
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import lru_cache
 from logging import Logger
 from typing import Optional, Tuple, Callable
 
@@ -24,10 +26,13 @@ import yaml
 from tabulate import tabulate
 
 from spark_rapids_dataproc_tools.utilities import is_system_tool, bail, YAMLPropertiesContainer, \
-    convert_dict_to_camel_case, get_gpu_short_name
+    convert_dict_to_camel_case, get_gpu_short_name, GPU_DEVICES, YAMLSafeLoader, YAMLSafeDumper
 
 is_mac = os.uname().sysname == 'Darwin'
 
+# matches the memory of a GPU device in the output of nvidia-smi (i.e., 15109 MiB)
+GPU_MEMORY_PATTERN = re.compile(r'(\d+)\s+(MiB)', flags=re.MULTILINE)
+
 
 def validate_dataproc_sdk():
     """
@@ -59,14 +64,17 @@ def validate_region(region):
 
 
 def parse_supported_gpu(value: str) -> Optional[str]:
-    supported_list = ['T4', 'V100', 'K80', 'A100', 'P100']
     normalized = value.upper()
-    for gpu_device in supported_list:
-        if normalized.find(gpu_device) != -1:
+    for gpu_device in GPU_DEVICES:
+        if gpu_device in normalized:
             return gpu_device
     return None
 
 
+# number of cores of the N1 machine types available on Dataproc
+DATAPROC_N1_CORES = (2, 4, 8, 16, 32, 64, 96)
+
+
 # N2-* and E2-* machines do not support GPUs.
 # we currently support only N1 machines
 def is_machine_compatible_for_gpu(machine_type: str) -> bool:
@@ -118,19 +126,17 @@ def get_incompatible_criteria(**criteria_container) -> dict:
 #
 # e.g. 'n2-standard-8' -> 'n1-standard-8'
 #      'n2-higmem-128' -> 'n1-highmem-96' as this is the highest one available
+# The result depends only on the machine type, so it is cached since the same types are converted
+# repeatedly while processing a cluster.
+@lru_cache(maxsize=None)
 def map_to_closest_supported_match(machine_type: str) -> str:
-    def get_core(core):
-        for c in dataproc_n1_cores:
-            if c >= core:
-                return c
-        return dataproc_n1_cores[-1]
-
     # todo assert that the machine_type is not supported
-    dataproc_n1_cores = [2, 4, 8, 16, 32, 64, 96]
     instance_name_parts = machine_type.split('-')
     # The last bit of the instance name is the number of cores
-    original_core = instance_name_parts[-1]
-    return f'n1-{instance_name_parts[1]}-{get_core(int(original_core))}'
+    original_core = int(instance_name_parts[-1])
+    # pick the smallest number of cores that fits the original one, or the highest one available
+    core_ind = min(bisect_left(DATAPROC_N1_CORES, original_core), len(DATAPROC_N1_CORES) - 1)
+    return f'n1-{instance_name_parts[1]}-{DATAPROC_N1_CORES[core_ind]}'
 
 
 def default_gpu_device_memory(machine_type: str, gpu_device: str) -> int:
@@ -156,7 +162,7 @@ def default_gpu_device_memory(machine_type: str, gpu_device: str) -> int:
         'K80': 12288
     }
     gpu_memory_in_mib = memory_sizes.get(gpu_device)
-    if gpu_device == 'A100' and machine_type.lower().find('ultragpu') != -1:
+    if gpu_device == 'A100' and 'ultragpu' in machine_type.lower():
         return gpu_memory_in_mib * 2
     return gpu_memory_in_mib
 
@@ -212,19 +218,13 @@ class CMDRunner:
         if not fail_ok:
             self._check_subprocess_result(c, expected=expected, msg_fail=msg_fail)
         std_output = c.stdout.decode('utf-8')
-        std_error = c.stderr.decode('utf-8')
         if self.debug:
-            # reformat lines to make the log more readable
-            std_output_lines = [f'\t| {line}' for line in std_output.splitlines()]
-            std_error_lines = [f'\t| {line}' for line in std_error.splitlines()]
-            stdout_str = ''
-            stderr_str = ''
-            if len(std_output_lines) > 0:
-                std_out_lines = '\n'.join(std_output_lines)
-                stdout_str = f'\n\t<STDOUT>\n{std_out_lines}'
-            if len(std_error_lines) > 0:
-                std_err_lines = '\n'.join(std_error_lines)
-                stderr_str = f'\n\t<STDERR>\n{std_err_lines}'
+            # the stderr is only needed for the debug log. Decode and reformat the lines to make the
+            # log more readable only when debug is enabled.
+            std_out_lines = '\n'.join(f'\t| {line}' for line in std_output.splitlines())
+            std_err_lines = '\n'.join(f'\t| {line}' for line in c.stderr.decode('utf-8').splitlines())
+            stdout_str = f'\n\t<STDOUT>\n{std_out_lines}' if std_out_lines else ''
+            stderr_str = f'\n\t<STDERR>\n{std_err_lines}' if std_err_lines else ''
             self.logger.debug('executing CMD:\n\t<CMD: %s>[%s]; [%s]', cmd, stdout_str, stderr_str)
         return std_output
 
@@ -300,6 +300,9 @@ class DataprocClusterPropContainer(YAMLPropertiesContainer):
     cli: CMDRunner = None
     uuid: str = field(default=None, init=False)
     workers_count: int = field(default=None, init=False)
+    # the description of a machine type does not change during a run. Cache the results of the
+    # describe command to avoid calling gcloud for every lookup of the same (zone, machine_type).
+    machine_types_cache: dict = field(default_factory=dict, init=False)
 
     def _process_loaded_props(self) -> None:
         """
@@ -332,13 +335,15 @@ class DataprocClusterPropContainer(YAMLPropertiesContainer):
     def get_cpu_info_for_machine_type(self, zone: str, machine_type: str) -> (str, str):
         """
         This method can be used for offline clusters because it does not ssh to the cluster.
+        The result is cached per (zone, machine_type) for the lifetime of the container.
         """
-        exec_cmd = f'compute machine-types describe {machine_type} --zone={zone}'
-        raw_output = self.cli.gcloud(exec_cmd)
-        type_config = yaml.safe_load(raw_output)
-        num_cpus = type_config['guestCpus']
-        cpu_mem = type_config['memoryMb']
-        return num_cpus, cpu_mem
+        cache_key = (zone, machine_type)
+        if cache_key not in self.machine_types_cache:
+            exec_cmd = f'compute machine-types describe {machine_type} --zone={zone}'
+            raw_output = self.cli.gcloud(exec_cmd)
+            type_config = yaml.load(raw_output, Loader=YAMLSafeLoader)
+            self.machine_types_cache[cache_key] = (type_config['guestCpus'], type_config['memoryMb'])
+        return self.machine_types_cache[cache_key]
 
     def _get_cpu_info_for_node(self, node_type: str) -> (str, str):
         type_uri = self.get_value('config', f'{node_type}Config', 'machineTypeUri')
@@ -465,7 +470,7 @@ class DataprocClusterPropContainer(YAMLPropertiesContainer):
         gpu_info = self._pull_worker_gpu_memories()
         # sometimes the output of the command may include SSH warning messages.
         # match only lines in with expression in the following format (15109 MiB)
-        match_arr = re.findall(r'(\d+)\s+(MiB)', gpu_info, flags=re.MULTILINE)
+        match_arr = GPU_MEMORY_PATTERN.findall(gpu_info)
         num_gpus = len(match_arr)
         gpu_mem = 0
         if num_gpus == 0:
@@ -508,7 +513,7 @@ class DataprocClusterPropContainer(YAMLPropertiesContainer):
 
     def write_as_yaml_file(self, file_path: str):
         with open(file_path, 'w', encoding='utf-8') as yaml_file:
-            yaml.dump(self.props, yaml_file, sort_keys=False)
+            yaml.dump(self.props, yaml_file, Dumper=YAMLSafeDumper, sort_keys=False)
 
     def worker_pretty_print(self, extra_args: dict = None, headers: Tuple = (), prefix='\n') -> str:
         gpu_region, gpu_zone, gpu_worker_machine = self.get_worker_machine_info()
@@ -517,8 +522,7 @@ class DataprocClusterPropContainer(YAMLPropertiesContainer):
                  ['Region', gpu_region],
                  ['Zone', gpu_zone]]
         if extra_args is not None:
-            for prop_k, prop_v in extra_args.items():
-                lines.append([prop_k, prop_v])
+            lines.extend([prop_k, prop_v] for prop_k, prop_v in extra_args.items())
         return f'{prefix}{tabulate(lines, headers)}'
 
     def convert_props_to_dict(self) -> dict:
@@ -17,8 +17,9 @@ import sys
 
 import fire
 
-from spark_rapids_dataproc_tools.diag_dataproc import DiagDataproc
-from spark_rapids_dataproc_tools.rapids_models import Profiling, Qualification, Bootstrap
+# The modules implementing the tools are imported inside the command that runs them. This avoids
+# loading pandas, tabulate and the diagnostic dependencies when running a command that does not need
+# them.
 
 
 class DataprocWrapper(object):
@@ -58,6 +59,9 @@ class DataprocWrapper(object):
         :param debug: True or False to enable verbosity to the wrapper script.
 
         """
+        # pylint: disable=import-outside-toplevel
+        from spark_rapids_dataproc_tools.rapids_models import Bootstrap
+
         boot_tool = Bootstrap(cluster=cluster,
                               region=region,
                               dry_run=dry_run,
@@ -118,6 +122,9 @@ class DataprocWrapper(object):
             For more details on Profiling tool options, please visit
             https://nvidia.github.io/spark-rapids/docs/spark-profiling-tool.html#profiling-tool-options.
         """
+        # pylint: disable=import-outside-toplevel
+        from spark_rapids_dataproc_tools.rapids_models import Profiling
+
         prof_tool = Profiling(
             cluster=cluster,
             region=region,
@@ -219,6 +226,9 @@ class DataprocWrapper(object):
             For more details on Qualification tool options, please visit
             https://nvidia.github.io/spark-rapids/docs/spark-qualification-tool.html#qualification-tool-options.
         """
+        # pylint: disable=import-outside-toplevel
+        from spark_rapids_dataproc_tools.rapids_models import Qualification
+
         qualification_tool = Qualification(
             cluster=cluster,
             region=region,
@@ -271,6 +281,9 @@ class DataprocWrapper(object):
             raise Exception('Invalid cluster or region for Dataproc environment. '
                             'Please provide options "--cluster=<CLUSTER_NAME> --region=<REGION>" properly.')
 
+        # pylint: disable=import-outside-toplevel
+        from spark_rapids_dataproc_tools.diag_dataproc import DiagDataproc
+
         diag = DiagDataproc(cluster, region, debug)
 
         # Run diagnostic function
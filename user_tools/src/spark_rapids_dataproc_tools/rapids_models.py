@@ -14,18 +14,20 @@
 
 """Classes and Interfaces of the RAPIDS Accelerator for Apache Spark plugin."""
 
-import glob
 import logging.config
 import os
 import re
+import shlex
 import subprocess
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from logging import Logger
 from typing import Any, Optional, List, Dict
 from urllib.error import URLError
 from urllib.request import urlopen
 
+import numpy as np
 import pandas as pd
 import yaml
 from tabulate import tabulate
@@ -36,7 +38,13 @@ from spark_rapids_dataproc_tools.dataproc_utils import validate_dataproc_sdk, ge
     validate_region, CMDRunner, DataprocClusterPropContainer, DataprocShadowClusterPropContainer, \
     get_incompatible_criteria
 from spark_rapids_dataproc_tools.utilities import bail, \
-    get_log_dict, remove_dir, make_dirs, resource_path, YAMLPropertiesContainer, gen_random_string
+    get_log_dict, remove_dir, make_dirs, resource_path, YAMLPropertiesContainer, gen_random_string, \
+    list_dir_entries, YAMLSafeDumper
+
+# an argument value that has to be quoted on the command line
+QUOTED_ARG_PATTERN = re.compile(r'\s|\(|\)|,')
+# the row of the application name in the output of the profiling tool
+APP_NAME_PATTERN = re.compile(r'(\|spark\.app\.name\s+\|)(.+)\|', flags=re.MULTILINE)
 
 
 @dataclass
@@ -61,14 +69,15 @@ class ToolContext(YAMLPropertiesContainer):
     def set_fail_actions(self, method):
         self.cli.fail_action_cb = method
 
-    def loginfo(self, msg: str):
-        self.logger.info(msg)
+    def loginfo(self, msg: str, *args):
+        self.logger.info(msg, *args)
 
-    def logdebug(self, msg: str):
-        self.logger.debug(msg)
+    def logdebug(self, msg: str, *args):
+        # args are formatted lazily by the logger only if debug messages are enabled
+        self.logger.debug(msg, *args)
 
-    def logwarn(self, msg: str):
-        self.logger.warning(msg)
+    def logwarn(self, msg: str, *args):
+        self.logger.warning(msg, *args)
 
     def set_remote(self, key: str, val: Any):
         self.props['remoteCtx'][key] = val
@@ -85,7 +94,7 @@ class ToolContext(YAMLPropertiesContainer):
     def set_local_workdir(self, parent: str):
         relative_path = self.get_value('platform', 'workDir')
         local_work_dir = os.path.join(parent, relative_path)
-        self.logdebug(f'creating dependency folder {local_work_dir}')
+        self.logdebug('creating dependency folder %s', local_work_dir)
         # first delete the folder if it exists
         remove_dir(local_work_dir, fail_on_error=False)
         # now create the new folder
@@ -93,7 +102,7 @@ class ToolContext(YAMLPropertiesContainer):
         self.set_local('depFolder', local_work_dir)
         output_folder = os.path.join(local_work_dir, self.get_value('platform', 'outputDir'))
         self.set_local('toolOutputFolder', output_folder)
-        self.logdebug(f'setting local output folder of the tool to {self.get_local("toolOutputFolder")}')
+        self.logdebug('setting local output folder of the tool to %s', self.get_local('toolOutputFolder'))
 
     def get_remote_output_dir(self) -> str:
         remote_work_dir = self.get_remote('depFolder')
@@ -162,8 +171,9 @@ class RapidsTool(object):
                 # a boolean flag, does not need to have its value added to the list
                 if isinstance(value, str):
                     # if the argument is multiple word, then protect it with single quotes.
-                    if re.search(r'\s|\(|\)|,', value):
-                        value = f"'{value}'"
+                    # shlex takes care of escaping any quotes embedded in the value.
+                    if QUOTED_ARG_PATTERN.search(value):
+                        value = shlex.quote(value)
                 self.tool_options.setdefault(key, []).append(value)
             else:
                 if value:
@@ -173,11 +183,22 @@ class RapidsTool(object):
                     # we need to restore the original key
                     self.tool_options.setdefault(f'no{key}', [])
 
-    def accept_tool_option(self, option_key: str) -> bool:
+    @cached_property
+    def _defined_tool_options(self) -> Optional[frozenset]:
+        """
+        The options accepted by the tool. Loaded once from the configuration as a set to allow
+        constant time lookups while processing the CLI arguments.
+        """
         defined_tool_options = self.ctxt.get_value_silent('sparkRapids', 'cli', 'tool_options')
+        if defined_tool_options is None:
+            return None
+        return frozenset(defined_tool_options)
+
+    def accept_tool_option(self, option_key: str) -> bool:
+        defined_tool_options = self._defined_tool_options
         if defined_tool_options is not None:
             if option_key not in defined_tool_options:
-                self.ctxt.logwarn(f"Ignoring tool option '{option_key}'. Invalid option.")
+                self.ctxt.logwarn("Ignoring tool option '%s'. Invalid option.", option_key)
                 return False
         return True
 
@@ -189,7 +210,7 @@ class RapidsTool(object):
         """
         arguments_list = []
         for key, value in self.tool_options.items():
-            self.ctxt.logdebug(f'Processing tool CLI argument.. {key}:{value}')
+            self.ctxt.logdebug('Processing tool CLI argument.. %s:%s', key, value)
             if len(key) > 1:
                 # python forces "_" to "-". we need to reverse that back.
                 fixed_key = key.replace('_', '-')
@@ -202,12 +223,11 @@ class RapidsTool(object):
                 k_arg = f'{prefix}{fixed_key}'
                 if len(value) >= 1:
                     # handle list options
-                    for value_entry in value[0:]:
-                        arguments_list.append(f'{k_arg}')
-                        arguments_list.append(f'{value_entry}')
+                    for value_entry in value:
+                        arguments_list.extend([k_arg, str(value_entry)])
                 else:
                     # this could be a boolean type flag that has no arguments
-                    arguments_list.append(f'{k_arg}')
+                    arguments_list.append(k_arg)
         return arguments_list
 
     def get_wrapper_arguments(self, arg_list: List[str]) -> List[str]:
@@ -227,14 +247,14 @@ class RapidsTool(object):
     def _report_tool_full_location(self) -> str:
         out_folder_path = os.path.abspath(self.ctxt.get_local_output_dir())
         res_arr = [f'{self.name.capitalize()} tool output is saved to local disk {out_folder_path}']
-        subfiles = glob.glob(f'{out_folder_path}/*', recursive=False)
+        subfiles = list_dir_entries(out_folder_path)
         if len(subfiles) > 0:
             res_arr.append(f'\t{os.path.basename(out_folder_path)}/')
             for sub_file in subfiles:
-                if os.path.isdir(sub_file):
-                    leaf_name = f'└── {os.path.basename(sub_file)}/'
+                if sub_file.is_dir():
+                    leaf_name = f'└── {sub_file.name}/'
                 else:
-                    leaf_name = f'├── {os.path.basename(sub_file)}'
+                    leaf_name = f'├── {sub_file.name}'
                 res_arr.append(f'\t\t{leaf_name}')
             doc_url = self.ctxt.get_value('sparkRapids', 'outputDocURL')
             res_arr.append(f'- To learn more about the output details, visit '
@@ -258,7 +278,7 @@ class RapidsTool(object):
             self.config_path = resource_path(f'{self.name}-conf.yaml')
         self.ctxt = ToolContext(prop_arg=self.config_path, name=self.name, debug=self.debug)
         self.ctxt.set_fail_actions(self.terminate)
-        self.ctxt.logdebug(f'config_path = {self.config_path}')
+        self.ctxt.logdebug('config_path = %s', self.config_path)
 
     def __post_init__(self):
         pass
@@ -291,7 +311,7 @@ class RapidsTool(object):
             # we should download the jar file
             local_jar_path = os.path.join(self.ctxt.get_local_work_dir(), self.ctxt.get_default_jar_name())
             wget_cmd = f'wget -O "{local_jar_path}" "{self.ctxt.get_rapids_jar_url()}"'
-            self.ctxt.logdebug(f'Downloading tools jar from {self.ctxt.get_rapids_jar_url()} to {local_jar_path}')
+            self.ctxt.logdebug('Downloading tools jar from %s to %s', self.ctxt.get_rapids_jar_url(), local_jar_path)
             self.ctxt.cli.run(wget_cmd,
                               msg_fail='Failed downloading tools jar url')
             jar_file_name = self.ctxt.get_default_jar_name()
@@ -300,8 +320,8 @@ class RapidsTool(object):
             if self.tools_jar.startswith('gs://'):
                 # this is a gstorage_path
                 # use gsutil command to get it on local disk first
-                self.ctxt.logdebug(f'Downloading the toolsJar {self.tools_jar} to local disk '
-                                   f'{self.ctxt.get_local_work_dir()}')
+                self.ctxt.logdebug('Downloading the toolsJar %s to local disk %s',
+                                   self.tools_jar, self.ctxt.get_local_work_dir())
                 self.ctxt.cli.gcloud_cp(self.tools_jar,
                                         self.ctxt.get_local_work_dir(),
                                         is_dir=False)
@@ -311,7 +331,7 @@ class RapidsTool(object):
                 copy_jar_cmd = f'cp "{self.tools_jar}" "{self.ctxt.get_local_work_dir()}"'
                 self.ctxt.cli.run(copy_jar_cmd, msg_fail='Failed to copy the Jar tools to the dep folder')
                 jar_file_name = os.path.basename(self.tools_jar)
-        self.ctxt.logdebug(f'the toolsJar fileName: {jar_file_name}')
+        self.ctxt.logdebug('the toolsJar fileName: %s', jar_file_name)
         self.ctxt.set_remote('jarFileName', jar_file_name)
 
     def _process_event_logs(self):
@@ -327,7 +347,7 @@ class RapidsTool(object):
             processed_logs = logs_dir
         self.ctxt.set_remote('eventlogs', ' '.join(processed_logs))
         logs = self.ctxt.get_remote('eventlogs')
-        self.ctxt.logdebug(f'Eventlogs are set to {logs}')
+        self.ctxt.logdebug('Eventlogs are set to %s', logs)
 
     def _prepare_dependencies(self):
         """
@@ -345,7 +365,7 @@ class RapidsTool(object):
         self.ctxt.loginfo('Preparing remote work env')
         # set the staging directory
         self.ctxt.set_remote_workdir(self.exec_cluster_proxy.get_temp_gs_storage())
-        self.ctxt.logdebug(f'cleaning up the remote work dir if it exists {self.ctxt.get_remote_work_dir()}')
+        self.ctxt.logdebug('cleaning up the remote work dir if it exists %s', self.ctxt.get_remote_work_dir())
         self.ctxt.cli.gcloud_rm(self.ctxt.get_remote_work_dir(), fail_ok=True)
 
     def _execute_tool(self):
@@ -389,7 +409,7 @@ class RapidsTool(object):
 
     def _upload_dependencies(self):
         self.ctxt.loginfo('Upload dependencies to remote cluster')
-        self.ctxt.logdebug(f'Uploading {self.ctxt.get_local_work_dir()} to {self.ctxt.get_remote_work_dir()}')
+        self.ctxt.logdebug('Uploading %s to %s', self.ctxt.get_local_work_dir(), self.ctxt.get_remote_work_dir())
         self.ctxt.cli.gcloud_cp(self.ctxt.get_local_work_dir(), self.ctxt.get_remote_work_dir())
 
     def _process_tool_output(self):
@@ -420,15 +440,16 @@ class RapidsTool(object):
                 # when this is failed run, remove the entire workdir
                 remove_dir(self.ctxt.get_local_work_dir(), fail_on_error=False)
             else:
-                sub_items = glob.glob(f'{self.ctxt.get_local_work_dir()}/*', recursive=False)
+                # the directory entries cache their type, so no extra stat is needed per child
+                sub_items = list_dir_entries(self.ctxt.get_local_work_dir())
                 output_dir = self.ctxt.get_wrapper_local_output()
-                for child_path in sub_items:
+                for child_entry in sub_items:
                     try:
-                        if output_dir != child_path:
-                            if os.path.isdir(child_path):
-                                remove_dir(child_path)
+                        if output_dir != child_entry.path:
+                            if child_entry.is_dir():
+                                remove_dir(child_entry.path)
                             else:
-                                os.remove(child_path)
+                                os.remove(child_entry.path)
                     except OSError:
                         self.ctxt.logwarn('Failed to cleanup remote data')
 
@@ -489,11 +510,11 @@ class Profiling(RapidsTool):
             pretty_type = cluster_type.upper()
             is_file_load = True
             prop_arg = config_file_path
-            self.ctxt.loginfo(f'The {pretty_type} cluster is an offline cluster. '
-                              f'Properties are loaded from {config_file_path}.')
+            self.ctxt.loginfo('The %s cluster is an offline cluster. '
+                              'Properties are loaded from %s.', pretty_type, config_file_path)
             if config_file_path.startswith('gs://'):
                 # This is a cloud storage. Get the data from the cloud using gsutil
-                self.ctxt.loginfo(f'Loading {pretty_type} cluster properties from remote url {config_file_path}.')
+                self.ctxt.loginfo('Loading %s cluster properties from remote url %s.', pretty_type, config_file_path)
                 fail_msg = f'Failed reading content of cluster properties located in {config_file_path}.'
                 prop_arg = self.ctxt.cli.gcloud_cat(config_file_path, msg_fail=fail_msg)
                 is_file_load = False
@@ -512,7 +533,8 @@ class Profiling(RapidsTool):
             prop_container.set_container_region('worker', proxy_region)
             prop_container.set_container_zone('master', proxy_zone)
             prop_container.set_container_zone('worker', proxy_zone)
-            self.ctxt.logdebug(f'Configurations used to construct {pretty_type} cluster: {prop_container.props}')
+            self.ctxt.logdebug('Configurations used to construct %s cluster: %s',
+                               pretty_type, prop_container.props)
             return prop_container
 
         # process the GPU cluster configurations
@@ -521,7 +543,7 @@ class Profiling(RapidsTool):
             # The argument is not set, then the dataproc properties is going to be same as
             # the CPU cluster.
             self.gpu_cluster_proxy = self.exec_cluster_proxy
-            self.ctxt.logdebug(f'the submission cluster on which the RAPIDS tool is running [{self.cluster}]')
+            self.ctxt.logdebug('the submission cluster on which the RAPIDS tool is running [%s]', self.cluster)
         else:
             self.gpu_cluster_proxy = construct_offline_prop_container(cluster_type='gpu',
                                                                       config_file_path=gpu_cluster_props_path)
@@ -536,9 +558,9 @@ class Profiling(RapidsTool):
         cluster_info_path = os.path.join(self.ctxt.get_local_work_dir(),
                                          'dataproc_worker_info.yaml')
         with open(cluster_info_path, 'w', encoding='utf-8') as worker_info_file:
-            self.ctxt.logdebug(f'Auto-tuner worker info file {cluster_info_path}')
-            self.ctxt.logdebug(f'Auto-tuner worker info: {cluster_info}')
-            yaml.dump(cluster_info, worker_info_file, sort_keys=False)
+            self.ctxt.logdebug('Auto-tuner worker info file %s', cluster_info_path)
+            self.ctxt.logdebug('Auto-tuner worker info: %s', cluster_info)
+            yaml.dump(cluster_info, worker_info_file, Dumper=YAMLSafeDumper, sort_keys=False)
             self.ctxt.set_remote('autoTunerFileName', 'dataproc_worker_info.yaml')
 
     def _prepare_dependencies(self):
@@ -547,32 +569,23 @@ class Profiling(RapidsTool):
 
     def __read_single_app_output(self, file_path: str) -> (List[str], List[str], str):
         def split_list_str_by_pattern(input_seq: List[str], pattern: str) -> int:
-            ind = 0
-            while ind < len(input_seq):
-                if input_seq[ind].find(pattern) != -1:
-                    return ind
-                ind += 1
-            return -1
+            return next((ind for ind, line in enumerate(input_seq) if pattern in line), -1)
 
         try:
             props_list = []
             comments_list = []
             app_name: str = ''
             with open(file_path, 'rt', encoding='utf-8') as app_profiler:
-                raw_lines = [line.strip() for line in app_profiler.readlines() if line.strip()]
-                # find the app_name
-                app_name_candidates = re.findall(r'(\|spark\.app\.name\s+\|)(.+)\|',
-                                                 '\n'.join(raw_lines),
-                                                 flags=re.MULTILINE)
-                if len(app_name_candidates) > 0:
-                    _, grp_2 = app_name_candidates[0]
-                    app_name = grp_2.strip()
-                header_pattern = self.ctxt.get_value('toolOutput', 'recommendations', 'headers',
-                                                     'section')
-                spark_pattern = self.ctxt.get_value('toolOutput', 'recommendations', 'headers',
-                                                    'sparkProperties')
-                comments_pattern = self.ctxt.get_value('toolOutput', 'recommendations', 'headers',
-                                                       'comments')
+                # iterate over the file object directly and strip each line only once
+                raw_lines = [line for line in map(str.strip, app_profiler) if line]
+                # find the app_name. Only the first match is used, so stop scanning once it is found
+                app_name_match = APP_NAME_PATTERN.search('\n'.join(raw_lines))
+                if app_name_match is not None:
+                    app_name = app_name_match.group(2).strip()
+                # walk the config tree once and unpack all the headers
+                headers = self.ctxt.get_value('toolOutput', 'recommendations', 'headers')
+                header_pattern, spark_pattern, comments_pattern = (
+                    headers[key] for key in ('section', 'sparkProperties', 'comments'))
                 begin_props_ind = -1
                 last_props_ind = -1
                 begin_comm_ind = -1
@@ -611,18 +624,17 @@ class Profiling(RapidsTool):
             all_incompatibilities = self.gpu_cluster_proxy.check_all_incompatibilities()
             if len(all_incompatibilities):
                 report_content = ['Configuration Incompatibilities:']
-                incompatibility_summary = []
-                for key, comment in all_incompatibilities.get('comments').items():
-                    incompatibility_summary.append([key, f'- {comment}'])
+                incompatibility_summary = tuple((key, f'- {comment}')
+                                                for key, comment in all_incompatibilities.get('comments').items())
                 report_content.append(tabulate(incompatibility_summary))
-                print('\n'.join(report_content))
+                print(*report_content, sep='\n')
         except Exception as e:
-            self.ctxt.logdebug(f'Exception converting worker machine type {e}')
+            self.ctxt.logdebug('Exception converting worker machine type %s', e)
         super()._report_results_are_empty()
 
     def _process_tool_output(self):
         super()._process_tool_output()
-        app_folders = glob.glob(f'{self.ctxt.get_local_output_dir()}/*', recursive=False)
+        app_folders = list_dir_entries(self.ctxt.get_local_output_dir())
         wrapper_content = []
         if len(app_folders) == 0:
             curr_line = f'The {self.name.capitalize()} tool did not generate any output. Nothing to display.'
@@ -636,11 +648,12 @@ class Profiling(RapidsTool):
             print(header_str)
             wrapper_content.append(header_str)
             headers = self.ctxt.get_value('local', 'output', 'summaryColumns')
+            profile_file = self.ctxt.get_value('toolOutput', 'recommendations', 'fileName')
             for app_folder in app_folders:
-                if os.path.isdir(app_folder):
-                    app_id = os.path.basename(app_folder)
-                    profile_file = self.ctxt.get_value('toolOutput', 'recommendations', 'fileName')
-                    recommendations, comments, app_name = self.__read_single_app_output(f'{app_folder}/{profile_file}')
+                if app_folder.is_dir():
+                    app_id = app_folder.name
+                    app_profile_path = os.path.join(app_folder.path, profile_file)
+                    recommendations, comments, app_name = self.__read_single_app_output(app_profile_path)
                     row = [app_id, app_name, '\n'.join(recommendations), '\n'.join(comments)]
                     wrapper_content.append(app_id)
                     wrapper_content.append('\t{}'.format('\n\t'.join(recommendations)))
@@ -651,7 +664,8 @@ class Profiling(RapidsTool):
         wrapper_output_file = os.path.join(self.ctxt.get_local_output_dir(), output_file_name)
 
         with open(wrapper_output_file, 'w', encoding='utf-8') as wrapper_output:
-            wrapper_output.write('\n'.join(wrapper_content))
+            # stream the lines to the file instead of joining them into one large string first
+            print(*wrapper_content, sep='\n', end='', file=wrapper_output)
 
     def _run_tool_as_spark(self):
         super()._run_tool_as_spark()
@@ -663,7 +677,7 @@ class Profiling(RapidsTool):
 
         tool_arguments = self.generate_final_tool_arguments(['--auto-tuner',
                                                              '--worker-info',
-                                                             f'{worker_info_path}'])
+                                                             worker_info_path])
         submit_cmd_args = (
             f'--cluster={self.cluster}'
             f' --region={self.region}'
@@ -672,7 +686,7 @@ class Profiling(RapidsTool):
             f' --'
             f' {tool_arguments}'
         )
-        self.ctxt.logdebug(f'Going to submit job <submit spark {submit_cmd_args}>')
+        self.ctxt.logdebug('Going to submit job <submit spark %s>', submit_cmd_args)
         self.ctxt.cli.gcloud_submit_as_spark(submit_cmd_args, err_msg='Failed Submitting Spark job')
 
 
@@ -685,22 +699,34 @@ class QualificationSummary:
     all_apps: pd.DataFrame = None
     recommended_apps: pd.DataFrame = None
     df_result: pd.DataFrame = None
+    # the mask of the recommended apps in df_result. It is shared with the stdout report to avoid
+    # evaluating the recommendations again.
+    recommended_mask: pd.Series = None
+    # the summary is not modified after construction. The predicates are evaluated only once.
+    _is_empty: bool = field(default=True, init=False)
+    _has_gpu_recommendation: bool = field(default=False, init=False)
+    _has_tabular_result: bool = field(default=False, init=False)
 
-    def _get_total_durations(self) -> int:
-        if not self.is_empty():
-            return self.all_apps['App Duration'].sum()
-        return 0
+    def __post_init__(self):
+        self._is_empty = self.all_apps is None or self.all_apps.empty
+        self._has_gpu_recommendation = self.recommended_apps is not None and not self.recommended_apps.empty
+        self._has_tabular_result = self.df_result is not None and not self.df_result.empty
 
-    def _get_total_gpu_durations(self) -> int:
+    def _get_total_durations(self) -> (float, float):
+        """
+        Sum the durations of all the apps in a single reduction.
+        :return: tuple (total_apps_durations, total_gpu_durations)
+        """
         if not self.is_empty():
-            return self.all_apps['Estimated GPU Duration'].sum()
-        return 0
-
-    def _get_stats_total_cost(self) -> float:
-        return self.df_result['Estimated App Cost'].sum()
+            return tuple(self.all_apps[['App Duration', 'Estimated GPU Duration']].sum())
+        return 0, 0
 
-    def _get_stats_total_gpu_cost(self) -> float:
-        return self.df_result['Estimated GPU Cost'].sum()
+    def _get_stats_total_costs(self) -> (float, float):
+        """
+        Sum the estimated CPU and GPU costs of all the apps in a single reduction.
+        :return: tuple (total_app_cost, total_gpu_cost)
+        """
+        return tuple(self.df_result[['Estimated App Cost', 'Estimated GPU Cost']].sum())
 
     def _get_stats_total_apps(self) -> int:
         if not self.is_empty():
@@ -713,19 +739,13 @@ class QualificationSummary:
         return 0
 
     def is_empty(self) -> bool:
-        if self.all_apps is not None:
-            return self.all_apps.empty
-        return True
+        return self._is_empty
 
     def has_gpu_recommendation(self) -> bool:
-        if self.recommended_apps is not None:
-            return not self.recommended_apps.empty
-        return False
+        return self._has_gpu_recommendation
 
     def has_tabular_result(self) -> bool:
-        if self.df_result is not None:
-            return not self.df_result.empty
-        return False
+        return self._has_tabular_result
 
     def print_report(self,
                      app_name: str,
@@ -743,7 +763,7 @@ class QualificationSummary:
             # Qualification tool has no output
             print(f'{app_name} tool did not generate any valid rows')
             if self.comments is not None and len(self.comments) > 0:
-                print('\n'.join(self.comments))
+                print(*self.comments, sep='\n')
             return None
 
         if output_pprinter is not None:
@@ -757,7 +777,7 @@ class QualificationSummary:
                 abs_path = os.path.abspath(wrapper_csv_file)
                 report_content.append(f'Full savings and speedups CSV report: {abs_path}')
 
-            pretty_df = df_pprinter(self.df_result)
+            pretty_df = df_pprinter(self.df_result, self.recommended_mask)
             if pretty_df.empty:
                 # the results were reduced to no rows because of the filters
                 report_content.append(
@@ -768,28 +788,26 @@ class QualificationSummary:
         else:
             report_content.append(f'{app_name} tool found no records to show.')
 
-        total_app_cost = self._get_stats_total_cost()
-        total_gpu_cost = self._get_stats_total_gpu_cost()
+        total_app_cost, total_gpu_cost = self._get_stats_total_costs()
         estimated_gpu_savings = 0.0
         if total_app_cost > 0.0:
             estimated_gpu_savings = 100.0 - (100.0 * total_gpu_cost / total_app_cost)
         overall_speedup = 0.0
-        total_apps_durations = 1.0 * self._get_total_durations()
-        total_gpu_durations = self._get_total_gpu_durations()
+        total_apps_durations, total_gpu_durations = self._get_total_durations()
         if total_gpu_durations > 0:
             overall_speedup = total_apps_durations / total_gpu_durations
         report_content.append('Report Summary:')
-        report_summary = [['Total applications', self._get_stats_total_apps()],
-                          ['RAPIDS candidates', self._get_stats_recommended_apps()],
-                          ['Overall estimated speedup', format_float(overall_speedup)],
-                          ['Overall estimated cost savings', f'{format_float(estimated_gpu_savings)}%']]
+        report_summary = (('Total applications', self._get_stats_total_apps()),
+                          ('RAPIDS candidates', self._get_stats_recommended_apps()),
+                          ('Overall estimated speedup', format_float(overall_speedup)),
+                          ('Overall estimated cost savings', f'{format_float(estimated_gpu_savings)}%'))
         report_content.append(tabulate(report_summary, colalign=('left', 'right')))
         if self.comments is not None and len(self.comments) > 0:
             report_content.extend(f'- {line}' for line in self.comments)
         if self.has_gpu_recommendation() and config_provider is not None:
             report_content.append(config_provider())
 
-        print('\n'.join(report_content))
+        print(*report_content, sep='\n')
 
 
 @dataclass
@@ -805,6 +823,8 @@ class Qualification(RapidsTool):
     cuda: str = None
     cpu_cluster_proxy: DataprocClusterPropContainer = field(default=None, init=False)
     gpu_cluster_proxy: DataprocClusterPropContainer = field(default=None, init=False)
+    filter_recom_enabled: bool = field(default=False, init=False)
+    filter_pos_enabled: bool = field(default=False, init=False)
 
     def dump_str(self) -> str:
         return f'this is the {self.name} tool running {self.config_path}'
@@ -825,11 +845,11 @@ class Qualification(RapidsTool):
             pretty_type = cluster_type.upper()
             is_file_load = True
             prop_arg = config_file_path
-            self.ctxt.loginfo(f'The {pretty_type} cluster is an offline cluster. '
-                              f'Properties are loaded from {config_file_path}.')
+            self.ctxt.loginfo('The %s cluster is an offline cluster. '
+                              'Properties are loaded from %s.', pretty_type, config_file_path)
             if config_file_path.startswith('gs://'):
                 # This is a cloud storage. Get the data from the cloud using gsutil
-                self.ctxt.loginfo(f'Loading {pretty_type} cluster properties from remote url {config_file_path}.')
+                self.ctxt.loginfo('Loading %s cluster properties from remote url %s.', pretty_type, config_file_path)
                 fail_msg = f'Failed reading content of cluster properties located in {config_file_path}.'
                 prop_arg = self.ctxt.cli.gcloud_cat(config_file_path, msg_fail=fail_msg)
                 is_file_load = False
@@ -848,7 +868,8 @@ class Qualification(RapidsTool):
             prop_container.set_container_region('worker', proxy_region)
             prop_container.set_container_zone('master', proxy_zone)
             prop_container.set_container_zone('worker', proxy_zone)
-            self.ctxt.logdebug(f'Configurations used to construct {pretty_type} cluster: {prop_container.props}')
+            self.ctxt.logdebug('Configurations used to construct %s cluster: %s',
+                               pretty_type, prop_container.props)
             return prop_container
 
         # Start of main method body
@@ -872,9 +893,9 @@ class Qualification(RapidsTool):
             props_origin_msg = f'the submission cluster on which the RAPIDS tool is running [{self.cluster}]'
             if cpu_cluster_props_path is not None:
                 props_origin_msg = f'the original CPU cluster properties loaded from {cpu_cluster_props_path}'
-            self.ctxt.loginfo(f'The GPU cluster is the same as {props_origin_msg}. '
+            self.ctxt.loginfo('The GPU cluster is the same as %s. '
                               'To update the configuration of the GPU cluster, make sure to pass the '
-                              'properties file to the CLI arguments.')
+                              'properties file to the CLI arguments.', props_origin_msg)
         else:
             self.gpu_cluster_proxy = construct_offline_prop_container(cluster_type='gpu',
                                                                       config_file_path=gpu_cluster_props_path)
@@ -906,9 +927,10 @@ class Qualification(RapidsTool):
                     self.filter_apps = selected_filter
                 else:
                     self.ctxt.logwarn(
-                        f'Invalid argument filter_apps={selected_filter}.\n\t'
-                        f'Accepted options are: [{" | ".join(available_filters)}].\n\t'
-                        f'Falling-back to default filter: {default_filter}'
+                        'Invalid argument filter_apps=%s.\n\t'
+                        'Accepted options are: [%s].\n\t'
+                        'Falling-back to default filter: %s',
+                        selected_filter, ' | '.join(available_filters), default_filter
                     )
                     self.filter_apps = default_filter
 
@@ -919,6 +941,9 @@ class Qualification(RapidsTool):
         if self.cuda is None:
             self.cuda = self.ctxt.get_value('sparkRapids', 'gpu', 'cudaVersion')
         process_filter_opt(self.filter_apps)
+        # the filter does not change after this point. Check which one applies only once.
+        self.filter_recom_enabled = self.filter_apps == 'recommended'
+        self.filter_pos_enabled = self.filter_apps == 'savings'
 
     def __generate_qualification_configs(self) -> str:
         initialization_actions = self.ctxt.get_value('sparkRapids',
@@ -942,75 +967,84 @@ class Qualification(RapidsTool):
             all_incompatibilities = self.gpu_cluster_proxy.check_all_incompatibilities()
             if len(all_incompatibilities):
                 report_content = ['Configuration Incompatibilities:']
-                incompatibility_summary = []
-                for key, comment in all_incompatibilities.get('comments').items():
-                    incompatibility_summary.append([key, f'- {comment}'])
+                incompatibility_summary = tuple((key, f'- {comment}')
+                                                for key, comment in all_incompatibilities.get('comments').items())
                 report_content.append(tabulate(incompatibility_summary))
-                print('\n'.join(report_content))
+                print(*report_content, sep='\n')
         except Exception as e:
-            self.ctxt.logdebug(f'Exception converting worker machine type {e}')
+            self.ctxt.logdebug('Exception converting worker machine type %s', e)
         super()._report_results_are_empty()
 
     def _process_tool_output(self):
-        def get_costs_for_single_app(df_row,
-                                     estimator: DataprocSavingsEstimator) -> pd.Series:
-            est_cpu_cost, est_gpu_cost, est_savings = estimator.get_costs_and_savings(df_row['App Duration'],
-                                                                                      df_row['Estimated GPU Duration'])
-            return pd.Series([est_cpu_cost, est_gpu_cost, est_savings])
-
-        def get_recommended_apps(all_rows, selected_cols) -> pd.DataFrame:
-            speed_up_col = self.ctxt.get_value('toolOutput', 'csv', 'summaryReport',
-                                               'recommendations', 'speedUp', 'columnName')
-            recommended_vals = self.ctxt.get_value('toolOutput', 'csv', 'summaryReport',
-                                                   'recommendations', 'speedUp', 'selectedRecommendations')
-            mask = all_rows[speed_up_col].isin(recommended_vals)
-            return all_rows.loc[mask, selected_cols]
-
-        def process_df_for_stdout(raw_df):
+        # look up the summary report configurations once instead of walking the context for every use
+        summary_report_conf = self.ctxt.get_value('toolOutput', 'csv', 'summaryReport')
+        speed_up_conf = summary_report_conf['recommendations']['speedUp']
+        speed_up_col = speed_up_conf['columnName']
+        recommended_vals = speed_up_conf['selectedRecommendations']
+        # the stdout report configurations
+        stdout_cols = self.ctxt.get_value('local', 'output', 'summaryColumns')
+        saving_col = self.ctxt.get_value('local', 'output', 'savingColumn')
+        stdout_report_conf = self.ctxt.get_value('toolOutput', 'stdout', 'summaryReport')
+        time_from_conf = stdout_report_conf.get('timeUnits')
+        compact_width_enabled = stdout_report_conf.get('compactWidth')
+
+        def get_recommended_mask(all_rows: pd.DataFrame) -> pd.Series:
+            return all_rows[speed_up_col].isin(recommended_vals)
+
+        def squeeze_header(column: str) -> str:
+            """
+            Split long header titles on their last space so they span two lines on the stdout.
+            """
+            if len(column) > 10:
+                split_ch = ' '
+                split_pos = column.rfind(split_ch)
+                if split_pos > -1:
+                    return column[:split_pos] + '\n' + column[split_pos + len(split_ch):]
+            return column
+
+        # the stdout report always shows the same columns. Resolve the duration columns and the final
+        # headers once: the time unit is added to the duration headers and they are squeezed in one pass.
+        time_unit = '(s)' if time_from_conf == 's' else '(ms)'
+        stdout_duration_cols = [col for col in stdout_cols if 'Duration' in col]
+        stdout_headers = [col.replace('Duration', f'Duration{time_unit}') for col in stdout_cols]
+        if compact_width_enabled:
+            stdout_headers = [squeeze_header(col) for col in stdout_headers]
+
+        def process_df_for_stdout(raw_df, recommended_mask=None):
             """
             process the dataframe to be more readable on the stdout
             1- convert time durations to second
             2- shorten headers
+            :param raw_df: the dataframe of the apps to be displayed.
+            :param recommended_mask: the mask of the recommended apps in raw_df if it is already evaluated.
             """
-            selected_cols = self.ctxt.get_value('local', 'output', 'summaryColumns')
-            # check if any filters apply
-            filter_recom_enabled = (self.filter_apps == 'recommended')
-            filter_pos_enabled = (self.filter_apps == 'savings')
             # filter by recommendations if enabled
-            if filter_recom_enabled:
-                df_row = get_recommended_apps(raw_df, selected_cols)
-            else:
-                df_row = raw_df.loc[:, selected_cols]
-            if df_row.empty:
-                return df_row
-            # filter by savings if enabled
-            if filter_pos_enabled:
-                cost_col = self.ctxt.get_value('local', 'output', 'savingColumn')
-                cost_mask = df_row[cost_col] > 0.0
-                df_row = df_row.loc[cost_mask, selected_cols]
+            if self.filter_recom_enabled:
+                if recommended_mask is None:
+                    recommended_mask = get_recommended_mask(raw_df)
+                df_row = raw_df.loc[recommended_mask, stdout_cols]
+            elif self.filter_pos_enabled and not raw_df.empty:
+                # filter by savings while selecting the columns to gather the rows only once
+                cost_mask = raw_df[saving_col].to_numpy() > 0.0
+                if cost_mask.all():
+                    # all the apps have savings. Skip the boolean indexing and only select the columns
+                    df_row = raw_df.loc[:, stdout_cols]
+                else:
+                    df_row = raw_df.loc[cost_mask, stdout_cols]
                 if df_row.empty:
                     print('Found no qualified apps for cost savings.')
                     return df_row
-            time_unit = '(ms)'
-            time_from_conf = self.ctxt.get_value('toolOutput', 'stdout', 'summaryReport', 'timeUnits')
-            if time_from_conf == 's':
-                time_unit = '(s)'
-                # convert to seconds
-                for column in df_row[[col for col in df_row.columns if 'Duration' in col]]:
-                    df_row[column] = df_row[column].div(1000).round(2)
-            # change the header to include time unit
-            df_row.columns = df_row.columns.str.replace('Duration',
-                                                        f'Duration{time_unit}', regex=False)
-            # squeeze the header titles if enabled
-            if self.ctxt.get_value('toolOutput', 'stdout', 'summaryReport', 'compactWidth'):
-                for column in df_row.columns:
-                    if len(column) > 10:
-                        split_ch = ' '
-                        split_pos = column.rfind(split_ch)
-                        if split_pos > -1:
-                            new_column_name = column[:split_pos] + '\n' + column[split_pos + len(split_ch):]
-                            df_row.columns = df_row.columns.str.replace(column,
-                                                                        new_column_name, regex=False)
+            else:
+                df_row = raw_df.loc[:, stdout_cols]
+            if df_row.empty:
+                return df_row
+            if time_from_conf == 's' and stdout_duration_cols:
+                # convert to seconds. All the duration columns are converted as a single 2-D block, and
+                # the values are rounded in place to avoid a second temporary.
+                durations_in_sec = np.divide(df_row[stdout_duration_cols].to_numpy(dtype=np.float64), 1000.0)
+                df_row[stdout_duration_cols] = np.round(durations_in_sec, 2, out=durations_in_sec)
+            # rename all the columns at once with the precomputed headers
+            df_row.columns = stdout_headers
             return df_row
 
         def create_savings_estimator() -> DataprocSavingsEstimator:
@@ -1025,19 +1059,19 @@ class Qualification(RapidsTool):
                 # load catalog from url
                 url_address = self.ctxt.get_value('local', 'costCalculation', 'catalog', 'onlineURL')
                 try:
-                    self.ctxt.loginfo(f'Downloading the price catalog from URL {url_address}')
+                    self.ctxt.loginfo('Downloading the price catalog from URL %s', url_address)
                     with urlopen(url_address) as response:
                         dataproc_catalog = DataprocCatalogContainer(prop_arg=response.read(), file_load=False)
                         self.ctxt.logdebug('Successful download of cloud pricing catalog')
                 except URLError as url_ex:
                     # failed to load the catalog from url, then revert to snapshot file
                     load_from_snapshot = True
-                    self.ctxt.logwarn(f'Failed to download the cloud pricing catalog with error {url_ex}.'
-                                      '\n\tFalling back to snapshot file.')
+                    self.ctxt.logwarn('Failed to download the cloud pricing catalog with error %s.'
+                                      '\n\tFalling back to snapshot file.', url_ex)
             if load_from_snapshot:
                 # load catalog from snapshot_file because either url has failed or it is disabled
                 snapshot_file = self.ctxt.get_value('local', 'costCalculation', 'catalog', 'snapshotFile')
-                self.ctxt.loginfo(f'Loading price catalog from snapshot file {snapshot_file}')
+                self.ctxt.loginfo('Loading price catalog from snapshot file %s', snapshot_file)
                 dataproc_catalog = DataprocCatalogContainer(resource_path(snapshot_file))
             price_provider = DataprocPriceProvider(name='dataprocCostEstimator',
                                                    catalog=dataproc_catalog)
@@ -1056,25 +1090,35 @@ class Qualification(RapidsTool):
                 all_apps: pd.DataFrame,
                 csv_out: str) -> QualificationSummary:
             # initialize the savings estimator
-            savings_estimator = create_savings_estimator()
+            try:
+                savings_estimator = create_savings_estimator()
+            except (LookupError, TypeError, ValueError) as ex:
+                # a price missing from the catalog (i.e., a GPU device not offered in the region) is
+                # returned as None and fails the arithmetic of the cost model
+                bail('Could not estimate the cost of the clusters from the price catalog', ex)
             if all_apps.empty:
                 return QualificationSummary(comments=savings_estimator.comments)
-            cols = self.ctxt.get_value('toolOutput', 'csv', 'summaryReport', 'columns')
+            cols = summary_report_conf['columns']
             cost_cols = self.ctxt.get_value('local', 'output', 'costColumns')
-            recommended_apps = get_recommended_apps(all_apps, cols)
-
-            # pick the apps to be used to generate the apps
-            apps_working_set = all_apps.loc[:, cols]
-            apps_working_set[cost_cols] = apps_working_set.apply(
-                lambda row: get_costs_for_single_app(row, estimator=savings_estimator), axis=1)
-            if not apps_working_set.empty:
-                self.ctxt.loginfo(
-                    f'Generating GPU Estimated Speedup and Savings as {csv_out}')
-                apps_working_set.to_csv(csv_out)
+            recommended_mask = get_recommended_mask(all_apps)
+            recommended_apps = all_apps.loc[recommended_mask, cols]
+
+            # estimate the costs of all the apps at once instead of going through them row by row
+            apps_costs = savings_estimator.get_costs_and_savings_for_apps(
+                all_apps['App Duration'].to_numpy(),
+                all_apps['Estimated GPU Duration'].to_numpy())
+            # add the costs to the loaded apps instead of copying the summary columns into a new frame.
+            # The CSV file selects and orders the columns while writing.
+            for cost_col, cost_values in zip(cost_cols, apps_costs):
+                all_apps[cost_col] = cost_values
+            self.ctxt.loginfo(
+                'Generating GPU Estimated Speedup and Savings as %s', csv_out)
+            all_apps.to_csv(csv_out, columns=cols + cost_cols)
             return QualificationSummary(comments=savings_estimator.comments,
                                         all_apps=all_apps,
                                         recommended_apps=recommended_apps,
-                                        df_result=apps_working_set)
+                                        df_result=all_apps,
+                                        recommended_mask=recommended_mask)
 
         super()._process_tool_output()
         # pylint: disable=broad-except
@@ -1085,21 +1129,28 @@ class Qualification(RapidsTool):
             bail(f'Could not Save the cluster properties as yaml file {file_name}', ex)
 
         summary_file = os.path.join(self.ctxt.get_local_output_dir(),
-                                    self.ctxt.get_value('toolOutput', 'csv', 'summaryReport', 'fileName'))
-        self.ctxt.logdebug(f'The local CSV file is {summary_file}')
+                                    summary_report_conf['fileName'])
+        self.ctxt.logdebug('The local CSV file is %s', summary_file)
+        # pylint: enable=broad-except
         try:
-            df = pd.read_csv(summary_file)
-            csv_file_name = self.ctxt.get_value('local', 'output', 'fileName')
-            local_csv = os.path.join(self.ctxt.get_wrapper_local_output(), csv_file_name)
-            report_summary = build_global_report_summary(df, local_csv)
-            report_summary.print_report(app_name=self.name.capitalize(),
-                                        wrapper_csv_file=local_csv,
-                                        config_provider=self.__generate_qualification_configs,
-                                        df_pprinter=process_df_for_stdout,
-                                        output_pprinter=self._report_tool_full_location)
-        except Exception as ex:
+            # the recommendation column holds a handful of repeated labels. Loading it as a category
+            # makes filtering by recommendation compare integer codes instead of strings.
+            # Only the columns of the summary report are loaded. The remaining columns of the CSV file
+            # are never used by the wrapper.
+            df = pd.read_csv(summary_file,
+                             usecols=summary_report_conf['columns'],
+                             dtype={speed_up_col: 'category'})
+        except (OSError, ValueError) as ex:
+            # pandas parsing errors are subclasses of ValueError
             bail('Error Parsing CSV file to generate Row Cost', ex)
-        # pylint: enable=broad-except
+        csv_file_name = self.ctxt.get_value('local', 'output', 'fileName')
+        local_csv = os.path.join(self.ctxt.get_wrapper_local_output(), csv_file_name)
+        report_summary = build_global_report_summary(df, local_csv)
+        report_summary.print_report(app_name=self.name.capitalize(),
+                                    wrapper_csv_file=local_csv,
+                                    config_provider=self.__generate_qualification_configs,
+                                    df_pprinter=process_df_for_stdout,
+                                    output_pprinter=self._report_tool_full_location)
 
     def _run_tool_as_spark(self):
         super()._run_tool_as_spark()
@@ -1114,7 +1165,7 @@ class Qualification(RapidsTool):
             f' --'
             f' {tool_arguments}'
         )
-        self.ctxt.logdebug(f'Going to submit job <submit spark {submit_cmd_args}>')
+        self.ctxt.logdebug('Going to submit job <submit spark %s>', submit_cmd_args)
         self.ctxt.cli.gcloud_submit_as_spark(submit_cmd_args, err_msg='Failed Submitting Spark job')
 
 
@@ -1182,10 +1233,8 @@ class Bootstrap(RapidsTool):
                 spark_settings = self.__calculate_spark_settings(num_cpus, cpu_mem, num_gpus, gpu_mem)
                 self.ctxt.set_remote('boot_spark_results', spark_settings)
                 self.ctxt.logdebug(
-                    f'{self.name} Tool finished calculating recommended Apache Spark configurations '
-                    f'for cluster {self.cluster}: '
-                    f'{str(spark_settings)}'
-                )
+                    '%s Tool finished calculating recommended Apache Spark configurations for cluster %s: %s',
+                    self.name, self.cluster, spark_settings)
             except Exception as e:
                 self.terminate(e, 'Error while calculating default Spark settings')
         except Exception as e:
@@ -1202,13 +1251,13 @@ class Bootstrap(RapidsTool):
         self._prepare_dependencies()
 
     def _apply_changes_to_remote_cluster(self):
-        self.ctxt.loginfo(f'Applying the configuration to remote cluster {self.cluster}')
+        self.ctxt.loginfo('Applying the configuration to remote cluster %s', self.cluster)
         apply_cmd = (
             f'gcloud {self.exec_cluster_proxy.get_driver_sshcmd_prefix()} '
             "--command=\"sudo bash -c 'cat >> /etc/spark/conf/spark-defaults.conf'\""
         )
         wrapper_out_content = self.ctxt.get_remote('wrapper_output_content')
-        self.ctxt.loginfo(f'Executing command {apply_cmd},\n\tinput =\n{wrapper_out_content}')
+        self.ctxt.loginfo('Executing command %s,\n\tinput =\n%s', apply_cmd, wrapper_out_content)
         # pylint: disable=subprocess-run-check
         c = subprocess.run(
             apply_cmd,
@@ -1225,15 +1274,14 @@ class Bootstrap(RapidsTool):
             # write the result to log file
             # Now create the new folder
             make_dirs(self.ctxt.get_wrapper_local_output(), exist_ok=True)
-            wrapper_out_content_arr = [f'##### BEGIN : RAPIDS bootstrap settings for {self.cluster}']
-            for conf_key, conf_val in tool_result.items():
-                wrapper_out_content_arr.append(f'{conf_key}={conf_val}')
-            wrapper_out_content_arr.append(f'##### END : RAPIDS bootstrap settings for {self.cluster}\n')
+            wrapper_out_content_arr = [f'##### BEGIN : RAPIDS bootstrap settings for {self.cluster}',
+                                       *[f'{conf_key}={conf_val}' for conf_key, conf_val in tool_result.items()],
+                                       f'##### END : RAPIDS bootstrap settings for {self.cluster}\n']
             wrapper_out_content = '\n'.join(wrapper_out_content_arr)
             self.ctxt.set_remote('wrapper_output_content', wrapper_out_content)
             if self.dry_run:
-                self.ctxt.loginfo(f'Skipping applying configurations to remote cluster {self.cluster}. '
-                                  ' DRY_RUN is enabled.')
+                self.ctxt.loginfo('Skipping applying configurations to remote cluster %s. '
+                                  ' DRY_RUN is enabled.', self.cluster)
             else:
                 # apply the changes to remote cluster
                 try:
@@ -1263,10 +1311,10 @@ class Bootstrap(RapidsTool):
         out_file_path = os.path.abspath(wrapper_output_file)
         with open(wrapper_output_file, 'w', encoding='utf-8') as wrapper_output:
             wrapper_output.write(wrapper_out_content)
-        self.ctxt.loginfo(f'Saving configuration to local file {out_file_path}')
+        self.ctxt.loginfo('Saving configuration to local file %s', out_file_path)
         wrapper_summary = [
             f'Recommended configurations are saved to local disk: {out_file_path}',
             'Using the following computed settings based on worker nodes:',
             wrapper_out_content
         ]
-        print('\n'.join(wrapper_summary))
+        print(*wrapper_summary, sep='\n')
@@ -22,7 +22,7 @@ import string
 import subprocess
 import sys
 from dataclasses import dataclass, field
-from functools import reduce
+from functools import lru_cache, reduce
 from json import JSONDecodeError
 from operator import getitem
 from pathlib import Path
@@ -31,6 +31,18 @@ from typing import Any
 
 import yaml
 
+# pylint: disable=unused-import
+try:
+    # use the LibYAML bindings when available. They are significantly faster than the pure python
+    # loader and dumper when parsing or writing the cluster properties and the configuration files.
+    from yaml import CSafeLoader as YAMLSafeLoader
+    # the dumper is not used in this module. It is exported for the modules that write yaml files.
+    from yaml import CSafeDumper as YAMLSafeDumper  # noqa: F401
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+    from yaml import SafeDumper as YAMLSafeDumper  # noqa: F401
+# pylint: enable=unused-import
+
 
 def get_log_dict(args):
     return {
@@ -57,6 +69,9 @@ def get_log_dict(args):
 
 logger = logging.getLogger(__name__)
 
+# short names of the GPU devices supported on Dataproc
+GPU_DEVICES = ('T4', 'V100', 'K80', 'A100', 'P100')
+
 
 def bail(msg, err):
     """
@@ -84,6 +99,18 @@ def get_elem_non_safe(data, keys):
         return None
 
 
+@lru_cache(maxsize=None)
+def to_camel_case(word: str) -> str:
+    """
+    Converts an underscore key to camelcase. The keys repeat across the nodes of the cluster properties,
+    so each key is converted only once.
+    :param word: the key to be converted (i.e., gce_cluster_config)
+    :return: the camelcase key (i.e., gceClusterConfig)
+    """
+    first_word, *other_words = word.split('_')
+    return first_word + ''.join(x.capitalize() or '_' for x in other_words)
+
+
 def convert_dict_to_camel_case(dic: dict):
     """
     Given a dictionary with underscore keys. This method converts the keys to a camelcase.
@@ -91,9 +118,6 @@ def convert_dict_to_camel_case(dic: dict):
     :param dic: the dictionary to be converted
     :return: a dictionary where all the keys are camelcase.
     """
-    def to_camel_case(word: str) -> str:
-        return word.split('_')[0] + ''.join(x.capitalize() or '_' for x in word.split('_')[1:])
-
     if isinstance(dic, list):
         return [convert_dict_to_camel_case(i) if isinstance(i, (dict, list)) else i for i in dic]
     res = {}
@@ -110,11 +134,11 @@ def gen_random_string(str_length: int) -> str:
 
 
 def get_gpu_device_list():
-    return ['T4', 'V100', 'K80', 'A100', 'P100']
+    return list(GPU_DEVICES)
 
 
 def is_valid_gpu_device(val):
-    return val.upper() in get_gpu_device_list()
+    return val.upper() in GPU_DEVICES
 
 
 def get_gpu_short_name(val: str) -> str:
@@ -124,8 +148,8 @@ def get_gpu_short_name(val: str) -> str:
     :return: the shortname of the GPU device (T4). otherwise, None.
     """
     upper_full_name = val.upper()
-    for short_name in get_gpu_device_list():
-        if upper_full_name.find(short_name) != -1:
+    for short_name in GPU_DEVICES:
+        if short_name in upper_full_name:
             return short_name
     return None
 
@@ -154,6 +178,21 @@ def make_dirs(dir_path: str, exist_ok: bool = True):
         bail(f'Error Creating directories {dir_path}', error)
 
 
+def list_dir_entries(dir_path: str) -> list:
+    """
+    List the entries of a directory skipping the hidden ones, similar to glob(f'{dir_path}/*').
+    The returned entries cache the file type, so checking whether an entry is a directory does not
+    require an extra stat call.
+    :param dir_path: the path of the directory to be listed.
+    :return: a list of os.DirEntry. An empty list if the directory cannot be read.
+    """
+    try:
+        with os.scandir(dir_path) as dir_entries:
+            return [entry for entry in dir_entries if not entry.name.startswith('.')]
+    except OSError:
+        return []
+
+
 def resource_path(resource_name: str) -> str:
     # pylint: disable=import-outside-toplevel
     if sys.version_info < (3, 9):
@@ -212,7 +251,7 @@ class AbstractPropertiesContainer(object):
         try:
             with open(self.prop_arg, 'r', encoding='utf-8') as yaml_file:
                 try:
-                    self.props = yaml.safe_load(yaml_file)
+                    self.props = yaml.load(yaml_file, Loader=YAMLSafeLoader)
                 except yaml.YAMLError as e:
                     bail('Incorrect format of Yaml File', e)
         except OSError as err:
@@ -224,7 +263,7 @@ class AbstractPropertiesContainer(object):
             self._load_properties_from_file()
         else:
             try:
-                self.props = yaml.safe_load(self.prop_arg)
+                self.props = yaml.load(self.prop_arg, Loader=YAMLSafeLoader)
             except yaml.YAMLError as e:
                 bail('Incorrect format of Yaml File', e)
 
@@ -0,0 +1,69 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the cost estimator functions."""
+
+import math
+
+import pytest  # pylint: disable=import-error
+
+from spark_rapids_dataproc_tools.cost_estimator import DataprocSavingsEstimator
+
+
+class TestCostEstimator:
+    """Test the estimation of the costs and savings of the apps."""
+
+    @pytest.fixture
+    def savings_estimator(self) -> DataprocSavingsEstimator:
+        # the hourly costs of the clusters are set directly, bypassing the price catalog
+        estimator = DataprocSavingsEstimator(price_provider=None)
+        estimator.cost_no_gpu = 2.5
+        estimator.cost_with_gpu = 4.0
+        return estimator
+
+    def test_costs_for_apps_match_single_app(self, savings_estimator):
+        """
+        The costs estimated for all the apps at once are the same as the costs estimated app by app:
+        - apps with zero or negative durations have no costs and no savings.
+        - a NaN duration propagates to the costs that depend on it.
+        """
+        app_durations = [0.0, -100.0, float('nan'), 60000.0, 60000.0, 7200000.0, 5000.0]
+        gpu_durations = [100.0, 100.0, 100.0, float('nan'), 20000.0, 1500000.0, 9000.0]
+        apps_costs = savings_estimator.get_costs_and_savings_for_apps(app_durations, gpu_durations)
+        for ind, (app_duration, gpu_duration) in enumerate(zip(app_durations, gpu_durations)):
+            expected_costs = savings_estimator.get_costs_and_savings(app_duration, gpu_duration)
+            actual_costs = [cost_values[ind] for cost_values in apps_costs]
+            assert actual_costs == pytest.approx(expected_costs, nan_ok=True)
+
+    def test_costs_for_apps_with_no_cpu_cost(self, savings_estimator):
+        """Apps with no positive duration must not be divided by zero."""
+        cpu_costs, gpu_costs, savings = savings_estimator.get_costs_and_savings_for_apps([0, -1], [10, 10])
+        assert list(cpu_costs) == [0.0, 0.0]
+        assert list(gpu_costs) == [0.0, 0.0]
+        assert list(savings) == [0.0, 0.0]
+
+    def test_costs_for_apps_with_nan_duration(self, savings_estimator):
+        """A NaN app duration produces NaN CPU cost and savings, similar to the single app estimation."""
+        cpu_costs, gpu_costs, savings = savings_estimator.get_costs_and_savings_for_apps([float('nan')], [10])
+        assert math.isnan(cpu_costs[0])
+        assert gpu_costs[0] == pytest.approx(savings_estimator.cost_with_gpu * 10 / (60.0 * 60 * 1000))
+        assert math.isnan(savings[0])
+
+    def test_estimators_do_not_share_comments(self):
+        """Each estimator has its own list of comments."""
+        first_estimator = DataprocSavingsEstimator(price_provider=None)
+        second_estimator = DataprocSavingsEstimator(price_provider=None)
+        first_estimator.comments.append('Cost estimation is based on 1 local SSD per worker.')
+        assert first_estimator.comments is not second_estimator.comments
+        assert not second_estimator.comments
@@ -20,6 +20,7 @@ from unittest.mock import patch
 import pytest  # pylint: disable=import-error
 
 from conftest import RapidsToolTestBasic, os_path_exists, mock_success_pull_cluster_props
+from spark_rapids_dataproc_tools.cost_estimator import DataprocPriceProvider
 from spark_rapids_dataproc_tools.dataproc_utils import CMDRunner
 from spark_rapids_dataproc_tools.rapids_models import Qualification
 
@@ -208,3 +209,20 @@ class TestQualification(RapidsToolTestBasic):
         pull_cluster_props.assert_called_once()
         mock_submit_as_spark.assert_called_once()
         assert mock_remote_copy.call_count == 2
+
+    def test_fail_missing_gpu_price(self, ut_dir, submission_cluster='dataproc-test-gpu-cluster'):
+        """
+        The price catalog may not have a price for the GPU device in the selected region.
+        The wrapper should fail and report the cost estimation error instead of a traceback.
+        """
+        std_reg_expressions = [
+            r'Could not estimate the cost of the clusters from the price catalog\.',
+            r'Terminated\.'
+        ]
+        with patch.object(CMDRunner, 'gcloud_describe_cluster',
+                          side_effect=mock_success_pull_cluster_props), \
+                patch.object(CMDRunner, 'gcloud_cp', side_effect=mock_remote_download), \
+                patch.object(Qualification, '_run_tool_as_spark', side_effect=mock_successful_run_as_spark), \
+                patch.object(DataprocPriceProvider, 'get_gpu_price', return_value=None):
+            self.run_fail_wrapper(submission_cluster, ut_dir)
+        self.assert_output_as_expected(std_reg_expressions)